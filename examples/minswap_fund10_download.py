@@ -13,6 +13,5 @@ seed_phrase = HDWallet.generate_mnemonic()
 
 # Create the Iagon session
 with IagonAdapter.session(seed_phrase) as session:
-    # Open a file to write the binary data to
-    with open("minswap_catalyst_groups.zip", "wb") as fw:
-        fw.write(session.download(file_id=file_id))
+    # Stream the binary data straight to a file
+    session.download_to(file_id=file_id, dst="minswap_catalyst_groups.zip")
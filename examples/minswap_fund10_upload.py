@@ -8,11 +8,11 @@ load_dotenv()
 seed_phrase = os.environ["SEED"]
 
 with iagon.IagonAdapter.session(seed_phrase) as session:
-    with open("minswap_catalyst_groups.zip", "rb") as fr:
-        file_id = session.upload(
-            "minswap_catalyst_groups.zip",
-            fr.read(),
-            private=False,
-        )
+    # Passing a path streams the file instead of reading it into memory
+    file_id = session.upload(
+        "minswap_catalyst_groups.zip",
+        "minswap_catalyst_groups.zip",
+        private=False,
+    )
 
     print(file_id)
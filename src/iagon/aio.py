@@ -0,0 +1,476 @@
+"""Asynchronous interface to Iagon, built on aiohttp.
+
+This mirrors `IagonAdapter` for code that already runs in an event loop, so that
+independent calls can be scheduled concurrently with `asyncio.gather`. It requires
+the optional `aiohttp` dependency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from contextlib import ExitStack
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING
+from typing import BinaryIO
+
+import aiohttp
+from pycardano import sign  # type: ignore [attr-defined]
+
+from .base import _BACKOFF_FACTOR
+from .base import _DEFAULT_TIMEOUT
+from .base import _DEFAULT_TRANSFER_TIMEOUT
+from .base import _HTTP_OK
+from .base import _MAX_RETRIES
+from .base import _TOKEN_CACHE
+from .base import _TOKEN_TTL
+from .base import CreateDirectorySuccess
+from .base import CreateFileSuccess
+from .base import DirectoryInfo
+from .base import FileId
+from .base import IagonAdapter
+from .base import ListSuccess
+from .base import NotAuthenticatedError
+from .base import Success
+from .base import Timeout
+from .base import _derive_session_identity
+from .base import _Endpoints
+from .base import _open_source
+from .base import _parse_response
+from .base import _token_cache_key
+from .base import _upload_form
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+def _client_timeout(timeout: Timeout) -> aiohttp.ClientTimeout:
+    """Convert a requests style timeout to an aiohttp timeout."""
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+
+    return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+
+class AsyncIagonAdapter(_Endpoints):
+    """Asynchronous low level Python interface to Iagon."""
+
+    url = IagonAdapter.url
+    auth_header: dict
+    timeout: Timeout
+    transfer_timeout: Timeout
+
+    def __init__(
+        self,
+        token: str | None = None,
+        timeout: Timeout = _DEFAULT_TIMEOUT,
+        transfer_timeout: Timeout = _DEFAULT_TRANSFER_TIMEOUT,
+        concurrency: int = 32,
+    ) -> None:
+        """Create an asynchronous Iagon object with an active auth token.
+
+        Must be created from within a running event loop.
+
+        Args:
+            token: Active auth token. Defaults to None.
+            timeout: Timeout for api calls, in seconds. Either a single value or a
+                (connect, read) pair. Defaults to (5, 30).
+            transfer_timeout: Timeout for file uploads and downloads. Defaults to
+                (5, None).
+            concurrency: Maximum number of simultaneous connections. Defaults to 32.
+        """
+        self.token = token
+        self.auth_header = {"Authorization": f"Bearer {token}"}
+
+        self.timeout = timeout
+        self.transfer_timeout = transfer_timeout
+
+        self._set_url(self.url)
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=concurrency,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            ),
+        )
+
+    async def close(self) -> None:
+        """Close the underlying http session and release pooled connections."""
+        await self._session.close()
+
+    async def __aenter__(self) -> Self:
+        """Use the adapter in an async context block."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the adapter on exiting the context block."""
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        auth: bool = True,
+        **kwargs: object,
+    ) -> dict:
+        """Send a request and parse the response.
+
+        The auth header is sent unless `auth` is False.
+        """
+        async with self._session.request(
+            method,
+            url,
+            headers=self.auth_header if auth else None,
+            timeout=_client_timeout(self.timeout),
+            **kwargs,  # type: ignore [arg-type]
+        ) as raw_response:
+            content = await raw_response.read()
+
+        return _parse_response(raw_response.status, content)
+
+    async def nonce(self, address: str) -> str:
+        """Request a nonce for authorization.
+
+        Args:
+            address: A bech32 address.
+
+        Returns:
+            A nonce.
+        """
+        response = await self._request(
+            "POST",
+            self.url + "/public/nonce",
+            auth=False,
+            data={"publicAddress": address},
+        )
+
+        return response["nonce"]
+
+    async def verify(self, address: str, signature: str, key: str) -> str:
+        """Verify CIP8 signed nonce and request auth token.
+
+        See `IagonAdapter.verify` for more information.
+
+        Args:
+            address: A bech32 address.
+            signature: A CIP8 signature.
+            key: A CIP8 key.
+
+        Returns:
+            An auth token.
+        """
+        response = await self._request(
+            "POST",
+            self.url + "/public/verify",
+            auth=False,
+            data={"publicAddress": address, "signature": signature, "key": key},
+        )
+
+        return response["session"]
+
+    async def _login(self, seed: str) -> str:
+        """Request a new auth token by signing a nonce with the wallet's stake key.
+
+        Args:
+            seed: A seed phrase for a wallet.
+
+        Returns:
+            An auth token.
+        """
+        # Wallet derivation is cpu bound, so keep it off the event loop
+        address, stake_key = await asyncio.to_thread(_derive_session_identity, seed)
+
+        # Sign the nonce with CIP8
+        nonce = await self.nonce(address)
+        signed_nonce = sign(
+            message=nonce,
+            signing_key=stake_key,
+            attach_cose_key=True,
+        )
+
+        # Request an auth token
+        return await self.verify(
+            address=address,
+            signature=signed_nonce["signature"],
+            key=signed_nonce["key"],
+        )
+
+    @classmethod
+    @asynccontextmanager
+    async def session(  # noqa: PLR0913
+        cls,
+        seed: str,
+        cache_token: bool = True,
+        token_ttl: float = _TOKEN_TTL,
+        timeout: Timeout = _DEFAULT_TIMEOUT,
+        transfer_timeout: Timeout = _DEFAULT_TRANSFER_TIMEOUT,
+        concurrency: int = 32,
+    ) -> AsyncGenerator[AsyncIagonAdapter, None]:
+        """Create an asynchronous Iagon session. Use in an async context block.
+
+        This behaves like `IagonAdapter.session`, and shares its auth token cache.
+        Logging in reuses the adapter's connection, so no extra handshake is needed
+        for the calls that follow.
+
+        Args:
+            seed: A seed phrase for a wallet.
+            cache_token: If True, reuse a cached auth token for this seed when one is
+                available. Defaults to True.
+            token_ttl: Seconds a newly acquired token is cached for. Defaults to 30
+                minutes.
+            timeout: Timeout for api calls, including login. Defaults to (5, 30).
+            transfer_timeout: Timeout for file uploads and downloads. Defaults to
+                (5, None).
+            concurrency: Maximum number of simultaneous connections. Defaults to 32.
+
+        Yields:
+            An AsyncIagonAdapter with a live session token.
+        """
+        cache_key = _token_cache_key(seed)
+        cached = _TOKEN_CACHE.get(cache_key) if cache_token else None
+
+        async with cls(
+            timeout=timeout,
+            transfer_timeout=transfer_timeout,
+            concurrency=concurrency,
+        ) as adapter:
+            if cached is not None and time.time() < cached[1]:
+                token = cached[0]
+            else:
+                token = await adapter._login(seed)
+                _TOKEN_CACHE[cache_key] = (token, time.time() + token_ttl)
+
+            adapter.token = token
+            adapter.auth_header = {"Authorization": f"Bearer {token}"}
+
+            try:
+                yield adapter
+            except NotAuthenticatedError:
+                _TOKEN_CACHE.pop(cache_key, None)
+                raise
+
+    async def check_auth(self) -> bool:
+        """Check if session is live. Currently does not work."""
+        response = await self._request("POST", self.url + "/public/checkauth")
+
+        return Success.model_validate(response).success
+
+    async def disconnect(self) -> None:
+        """Request auth token expiration. Currently does not work."""
+        await self._request("POST", self.url + "/public/disconnect")
+
+    async def create_directory(
+        self,
+        name: str,
+        parent_id: str | None = None,
+    ) -> DirectoryInfo:
+        """Create a new directory.
+
+        Args:
+            name: Name of the new directory. Must be unique.
+            parent_id: Id of the parent folder, if creating a subdirectory.
+                Defaults to None.
+
+        Returns:
+            Information about the newly created directory.
+        """
+        response = await self._request(
+            "POST",
+            self._url_create_dir,
+            json={"directory_name": name, "parent_directory_id": parent_id},
+        )
+
+        return CreateDirectorySuccess.model_validate(response).data
+
+    async def upload(  # noqa: PLR0913
+        self,
+        file_name: str,
+        file: bytes | bytearray | memoryview | str | Path | BinaryIO,
+        private: bool = True,
+        password: str = "default",  # noqa: S107
+        dir_id: str | None = None,
+        region_id: str | None = None,
+    ) -> FileId:
+        """Upload a file.
+
+        As with `IagonAdapter.upload`, only failures to connect are retried, with
+        exponential backoff. Nothing has been sent at that point, so a resend cannot
+        store the file twice. Gateway errors are not retried, since the file may
+        already have been stored. File objects cannot be read again, so they are
+        never retried.
+
+        Args:
+            file_name: Name of file to upload.
+            file: Data to upload. Can be raw bytes or another bytes-like buffer, a
+                path to a file, which is streamed from disk, or a readable binary
+                file object.
+            private: If true, file is only visible to the wallet address.
+                Defaults to True.
+            password: Password for encrypting the file. Defaults to "default".
+            dir_id: The directory id to place the file. If None, places in the
+                root folder. Defaults to None.
+            region_id: The region id for routing file upload. Defaults to None.
+
+        Returns:
+            The Id of the newly created file.
+        """
+        data = _upload_form(file_name, private, password, dir_id, region_id)
+        rereadable = isinstance(file, (bytes, bytearray, memoryview, str, Path))
+        retries = _MAX_RETRIES if rereadable else 0
+
+        for attempt in range(retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(_BACKOFF_FACTOR * 2 ** (attempt - 1))
+
+            try:
+                status, content = await self._post_upload(file_name, file, data)
+            except aiohttp.ClientConnectorError:
+                if attempt == retries:
+                    raise
+            else:
+                break
+
+        response = _parse_response(status, content)
+
+        return CreateFileSuccess.model_validate(response).data
+
+    async def _post_upload(
+        self,
+        file_name: str,
+        file: bytes | bytearray | memoryview | str | Path | BinaryIO,
+        data: dict,
+    ) -> tuple[int, bytes]:
+        """Send a single upload request, returning the status and response body."""
+        with ExitStack() as stack:
+            form = aiohttp.FormData(data)
+            form.add_field(
+                "file",
+                _open_source(file, stack),
+                filename=file_name,
+                content_type="application/octet-stream",
+            )
+
+            async with self._session.post(
+                self._url_upload,
+                data=form,
+                headers=self.auth_header,
+                timeout=_client_timeout(self.transfer_timeout),
+            ) as raw_response:
+                content = await raw_response.read()
+
+        return raw_response.status, content
+
+    async def download(
+        self,
+        file_id: str,
+        password: str = "default",  # noqa: S107
+    ) -> bytes:
+        """Download a file.
+
+        Args:
+            file_id: The id of the file to download.
+            password: The password to decrypt the file. Must match the upload password.
+                Defaults to "default".
+
+        Returns:
+            The raw bytes of the data.
+        """
+        async with self._session.post(
+            self._url_download,
+            data={"id": file_id, "password": password},
+            headers=self.auth_header,
+            timeout=_client_timeout(self.transfer_timeout),
+        ) as raw_response:
+            content = await raw_response.read()
+
+        if raw_response.status != _HTTP_OK:
+            _parse_response(raw_response.status, content)
+
+        return content
+
+    async def download_to(
+        self,
+        file_id: str,
+        dst: str | Path | BinaryIO,
+        password: str = "default",  # noqa: S107
+        chunk_size: int = 1 << 20,
+    ) -> None:
+        """Download a file, streaming it to a path or file object.
+
+        Args:
+            file_id: The id of the file to download.
+            dst: A file path, or a writable binary file object.
+            password: The password to decrypt the file. Must match the upload password.
+                Defaults to "default".
+            chunk_size: Number of bytes to read per chunk. Defaults to 1 MiB.
+        """
+        async with self._session.post(
+            self._url_download,
+            data={"id": file_id, "password": password},
+            headers=self.auth_header,
+            timeout=_client_timeout(self.transfer_timeout),
+        ) as raw_response:
+            if raw_response.status != _HTTP_OK:
+                _parse_response(raw_response.status, await raw_response.read())
+
+            with ExitStack() as stack:
+                fw = (
+                    stack.enter_context(Path(dst).open("wb"))
+                    if isinstance(dst, (str, Path))
+                    else dst
+                )
+                async for chunk in raw_response.content.iter_chunked(chunk_size):
+                    fw.write(chunk)
+
+    async def lsdir(
+        self,
+        path: list[str] | None = None,
+        private: bool = False,
+    ) -> ListSuccess:
+        """List of files and folders in the directory.
+
+        Args:
+            path: A list of folder ids defining the path to the folder. If None, lists
+                files and folders in the root directory. Defaults to None.
+            private: If True, displays private files. Defaults to False.
+
+        Returns:
+            An object containing files and folders in the directory.
+        """
+        async with self._session.get(
+            self._lsdir_url(path, private),
+            headers=self.auth_header,
+            timeout=_client_timeout(self.timeout),
+        ) as raw_response:
+            content = await raw_response.read()
+
+        if raw_response.status != _HTTP_OK:
+            _parse_response(raw_response.status, content)
+
+        return ListSuccess.model_validate_json(content)
+
+    async def delete_directory(self, dir_id: str) -> Success:
+        """Delete a directory.
+
+        This deletes a directory and the contents of the directory.
+
+        Args:
+            dir_id: The directory id.
+
+        Returns:
+            A success message, or an error if deletion was unsuccessful.
+        """
+        response = await self._request(
+            "DELETE",
+            self.url + f"/storage/directory/{dir_id}",
+        )
+
+        return Success.model_validate(response)
@@ -2,14 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import io
+import itertools
 import json
+import threading
+import time
+import uuid
 from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import ExitStack
 from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import BinaryIO
+from typing import Literal
 
 import requests
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore [assignment]
+
+try:
+    from . import structs
+except ImportError:  # pragma: no cover
+    structs = None  # type: ignore [assignment]
 
 from pycardano import Address  # type: ignore [attr-defined]
 from pycardano import HDWallet  # type: ignore [attr-defined]
@@ -17,6 +50,11 @@ from pycardano import PaymentExtendedSigningKey  # type: ignore [attr-defined]
 from pycardano import StakeExtendedSigningKey  # type: ignore [attr-defined]
 from pycardano import sign  # type: ignore [attr-defined]
 
+if TYPE_CHECKING:
+    from .aio import AsyncIagonAdapter
+    from .transport import HttpxResponse
+    from .transport import HttpxSession
+
 
 class BadRequestError(Exception):
     """Error when status code is 400, bad request error."""
@@ -38,14 +76,337 @@ class InternalServerError(Exception):
     """Error when status code is 500, not found error."""
 
 
-class Success(BaseModel):
+# Request timeout, either a single value or a (connect, read) pair
+Timeout = float | tuple[float, float] | tuple[float, None]
+
+# Default timeouts for api calls, and for file transfers that may take a while
+_DEFAULT_TIMEOUT: Timeout = (5.0, 30.0)
+_DEFAULT_TRANSFER_TIMEOUT: Timeout = (5.0, None)
+
+# HTTP status codes
+_HTTP_OK = 200
+_HTTP_BAD = 400
+_HTTP_UNAUTHORIZED = 401
+_HTTP_NOT_FOUND = 404
+_HTTP_CONFLICT = 409
+
+# Retry policy for transient gateway errors
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.5
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+def _create_session() -> requests.Session:
+    """Create a session with a pooled, retrying https adapter.
+
+    Transient failures are retried over the pooled connection rather than surfacing
+    to the caller. Once retries are exhausted, the last response is returned so it
+    can be handled as usual.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                connect=3,
+                read=3,
+                status=_MAX_RETRIES,
+                backoff_factor=_BACKOFF_FACTOR,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+                raise_on_status=False,
+            ),
+        ),
+    )
+
+    return session
+
+
+# Per-thread sessions for the unauthenticated endpoints used by classmethods
+_public_local = threading.local()
+
+
+def _public_session() -> requests.Session:
+    """Get this thread's warm session for the public endpoints."""
+    session = getattr(_public_local, "session", None)
+    if session is None:
+        session = _public_local.session = _create_session()
+
+    return session
+
+
+# Auth tokens keyed by a hash of the seed phrase, mapped to (token, expiry time)
+_TOKEN_CACHE: dict[str, tuple[str, float]] = {}
+_TOKEN_TTL = 30 * 60
+
+
+def _httpx_session() -> HttpxSession:
+    """Create an HTTP/2 capable session backed by httpx."""
+    try:
+        from .transport import HttpxSession
+    except ImportError as e:
+        msg = "httpx is required for the httpx transport: pip install iagon-py[http2]"
+        raise ImportError(msg) from e
+
+    return HttpxSession()
+
+
+def _token_cache_key(seed: str) -> str:
+    """Get the auth token cache key for a seed phrase, without storing the seed."""
+    return hashlib.blake2b(seed.encode(), digest_size=16).hexdigest()
+
+
+# Derived wallet identities keyed by a hash of the seed phrase, oldest first
+_IDENTITY_CACHE: dict[str, tuple[str, StakeExtendedSigningKey]] = {}
+_IDENTITY_CACHE_SIZE = 32
+
+
+def _derive_session_identity(seed: str) -> tuple[str, StakeExtendedSigningKey]:
+    """Derive the first address and stake signing key of a wallet.
+
+    Derivation is deterministic, so results are cached. The cache is keyed by a hash
+    of the seed phrase, so the seed itself is never retained.
+
+    Args:
+        seed: A seed phrase for a wallet.
+
+    Returns:
+        The hex encoded address and the stake signing key used for CIP8 signing.
+    """
+    cache_key = _token_cache_key(seed)
+    identity = _IDENTITY_CACHE.get(cache_key)
+    if identity is not None:
+        return identity
+
+    hdwallet = HDWallet.from_mnemonic(seed)
+    hdwallet_spend = hdwallet.derive_from_path("m/1852'/1815'/0'/0/0")
+    hdwallet_stake = hdwallet.derive_from_path("m/1852'/1815'/0'/2/0")
+    pay_key = PaymentExtendedSigningKey.from_hdwallet(hdwallet_spend)
+    stake_key = StakeExtendedSigningKey.from_hdwallet(hdwallet_stake)
+    address = Address(
+        payment_part=pay_key.to_verification_key().hash(),
+        staking_part=stake_key.to_verification_key().hash(),
+    )
+
+    if len(_IDENTITY_CACHE) >= _IDENTITY_CACHE_SIZE:
+        _IDENTITY_CACHE.pop(next(iter(_IDENTITY_CACHE)), None)
+    identity = _IDENTITY_CACHE[cache_key] = bytes(address).hex(), stake_key
+
+    return identity
+
+
+# Use orjson for response parsing when it is available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Error raised for each known failure status code
+_STATUS_ERRORS: dict[int, type[Exception]] = {
+    _HTTP_BAD: BadRequestError,
+    _HTTP_UNAUTHORIZED: NotAuthenticatedError,
+    _HTTP_NOT_FOUND: NotFoundError,
+    _HTTP_CONFLICT: DirectoryExistsError,
+}
+
+
+def _parse_response(status_code: int, content: bytes) -> dict:
+    """Parse a raw response body, raising an informative error on failure."""
+    if status_code == _HTTP_OK:
+        return _json_loads(content)
+
+    text = content.decode(errors="replace")
+    error = _STATUS_ERRORS.get(status_code)
+    if error is None:
+        msg = f"Error {status_code}: {text}"
+        raise BadRequestError(msg)
+
+    try:
+        message = _json_loads(content)["message"]
+    except (ValueError, TypeError, KeyError):
+        message = text
+
+    raise error(message)
+
+
+def _async_adapter(adapter: IagonAdapter, concurrency: int) -> AsyncIagonAdapter:
+    """Create an async adapter sharing the settings of a sync adapter."""
+    try:
+        from .aio import AsyncIagonAdapter
+    except ImportError as e:
+        msg = "aiohttp is required for bulk transfers: pip install iagon-py[async]"
+        raise ImportError(msg) from e
+
+    async_adapter = AsyncIagonAdapter(
+        adapter.token,
+        timeout=adapter.timeout,
+        transfer_timeout=adapter.transfer_timeout,
+        concurrency=concurrency,
+    )
+    async_adapter._set_url(adapter.url)
+
+    return async_adapter
+
+
+def _upload_form(
+    file_name: str,
+    private: bool,
+    password: str,
+    dir_id: str | None,
+    region_id: str | None,
+) -> dict:
+    """Build the form fields for a file upload."""
+    visibility = "private" if private else "public"
+    data = {"filename": file_name, "password": password, "visibility": visibility}
+    if dir_id is not None:
+        data.update(directoryId=dir_id)
+    if region_id is not None:
+        data.update(regionId=region_id)
+
+    return data
+
+
+# Multipart boundary shared by all pre-encoded upload bodies
+_BOUNDARY = uuid.uuid4().hex
+_MULTIPART_CLOSE = f"--{_BOUNDARY}--\r\n".encode()
+
+
+def _multipart_quote(value: str) -> str:
+    """Escape a multipart header parameter value."""
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _multipart_field(name: str, value: str) -> bytes:
+    """Encode a single text field of a multipart form."""
+    return (
+        f"--{_BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+        f"{value}\r\n"
+    ).encode()
+
+
+@functools.lru_cache(maxsize=32)
+def _multipart_fields(
+    private: bool,
+    dir_id: str | None,
+    region_id: str | None,
+) -> bytes:
+    """Encode the upload form fields that do not depend on the file or password.
+
+    These are the same for every file uploaded with the same settings, so they are
+    only encoded once. The password is encoded per upload, so that it is never
+    retained by the cache.
+    """
+    data = _upload_form("", private, "", dir_id, region_id)
+
+    return b"".join(
+        _multipart_field(name, value)
+        for name, value in data.items()
+        if name not in ("filename", "password")
+    )
+
+
+class _MultipartBody:
+    """A pre-encoded multipart upload body that streams the file it wraps.
+
+    The body is read as the cached form fields, the file's headers, the file itself,
+    and the closing boundary. Only the file name is encoded per upload, and the file
+    is never copied into the body. It exposes `read` and `len`, so it can be passed
+    directly as request data and sent with a known content length.
+    """
+
+    content_type = f"multipart/form-data; boundary={_BOUNDARY}"
+
+    def __init__(self, file_name: str, fields: bytes, fh: BinaryIO, size: int) -> None:
+        """Create an upload body.
+
+        Args:
+            file_name: Name of the uploaded file.
+            fields: The pre-encoded form fields.
+            fh: The file to upload, positioned at the start of the data to send.
+            size: The number of bytes left to read in `fh`.
+        """
+        quoted_name = _multipart_quote(file_name)
+        header = (
+            _multipart_field("filename", file_name)
+            + (
+                f"--{_BOUNDARY}\r\n"
+                "Content-Disposition: form-data; "
+                f'name="file"; filename="{quoted_name}"\r\n'
+                "Content-Type: application/octet-stream\r\n\r\n"
+            ).encode()
+        )
+        closing = b"\r\n" + _MULTIPART_CLOSE
+
+        self._parts: list[BinaryIO] = [
+            io.BytesIO(fields + header),
+            fh,
+            io.BytesIO(closing),
+        ]
+        self.len = len(fields) + len(header) + size + len(closing)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to `size` bytes of the body, or the rest of it if negative."""
+        chunks = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+
+        return b"".join(chunks)
+
+
+def _remaining_size(fh: BinaryIO) -> int | None:
+    """Get the number of bytes left to read in a file, if it can be determined."""
+    try:
+        if not fh.seekable():
+            return None
+        position = fh.tell()
+        size = fh.seek(0, io.SEEK_END) - position
+        fh.seek(position)
+    except (AttributeError, OSError):
+        return None
+
+    return size
+
+
+def _open_source(
+    source: bytes | bytearray | memoryview | str | Path | BinaryIO,
+    stack: ExitStack,
+) -> BinaryIO:
+    """Get a readable binary file object for an upload source.
+
+    Files opened from a path are registered with `stack` so they are closed when the
+    upload completes. In-memory data is wrapped in a `BytesIO` so it is streamed from
+    the caller's buffer, which shares the memory of `bytes` rather than copying it.
+    """
+    if isinstance(source, (str, Path)):
+        return stack.enter_context(Path(source).open("rb"))  # noqa: SIM115
+    elif isinstance(source, (bytes, bytearray, memoryview)):  # noqa: RET505
+        return io.BytesIO(source)
+
+    return source
+
+
+class IagonModel(BaseModel):
+    """Base class for Iagon response models."""
+
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+
+class Success(IagonModel):
     """Base class to parse a successful call."""
 
     success: bool
     message: str | None = None
 
 
-class FileId(BaseModel):
+class FileId(IagonModel):
     """The unique id of a file."""
 
     file_id: str = Field(..., alias="id")
@@ -57,7 +418,7 @@ class CreateFileSuccess(Success):
     data: FileId
 
 
-class FileInfo(BaseModel):
+class FileInfo(IagonModel):
     """File or chunk information."""
 
     file_id: str = Field(..., alias="_id")
@@ -75,7 +436,7 @@ class FileInfo(BaseModel):
     v: int = Field(..., alias="__v")
 
 
-class DirectoryInfo(BaseModel):
+class DirectoryInfo(IagonModel):
     """Directory information."""
 
     dir_id: str = Field(..., alias="_id")
@@ -87,11 +448,41 @@ class DirectoryInfo(BaseModel):
     v: int = Field(..., alias="__v")
 
 
-class ListResponse(BaseModel):
-    """Directory list information. Contains both files and folders."""
+class ListResponse(IagonModel):
+    """Directory list information. Contains both files and folders.
 
-    files: list[FileInfo]
-    directories: list[DirectoryInfo]
+    Listings are immutable, so the name and id sets used for membership checks are
+    built once and reused.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    files: tuple[FileInfo, ...]
+    directories: tuple[DirectoryInfo, ...]
+
+    def _index(self, entries: tuple[IagonModel, ...], attr: str) -> frozenset[str]:
+        """Get the set of `attr` values of `entries`, building it on first use.
+
+        The set is cached alongside the tuple it was built from, so a copy made with
+        `model_copy(update=...)` builds its own set rather than reusing a stale one.
+        """
+        key = f"_{attr}_index"
+        cached = self.__dict__.get(key)
+        if cached is None or cached[0] is not entries:
+            index = frozenset(getattr(entry, attr) for entry in entries)
+            cached = self.__dict__[key] = (entries, index)
+
+        return cached[1]
+
+    @property
+    def directory_names(self) -> frozenset[str]:
+        """Names of the directories, for fast membership checks."""
+        return self._index(self.directories, "directory_name")
+
+    @property
+    def file_ids(self) -> frozenset[str]:
+        """Ids of the files, for fast membership checks."""
+        return self._index(self.files, "file_id")
 
 
 class CreateDirectorySuccess(Success):
@@ -106,20 +497,97 @@ class ListSuccess(Success):
     data: ListResponse
 
 
-class IagonAdapter:
+_LISTING_MODELS: dict[str, type[FileInfo | DirectoryInfo]] = {
+    "files": FileInfo,
+    "directories": DirectoryInfo,
+}
+
+
+def _iter_listing(chunks: Iterable[bytes]) -> Iterator[FileInfo | DirectoryInfo]:
+    """Parse a streamed directory listing in a single pass.
+
+    Entries are validated as soon as they are complete, in the order they appear in
+    the response.
+    """
+    models = {f"data.{key}.item": model for key, model in _LISTING_MODELS.items()}
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events)
+    item_prefix, builder = None, None
+
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            parser.close()
+        else:
+            parser.send(chunk)
+
+        for prefix, event, value in events:
+            if builder is None:
+                if event == "start_map" and prefix in models:
+                    item_prefix, builder = prefix, ijson.ObjectBuilder()
+                else:
+                    continue
+
+            builder.event(event, value)
+            if event == "end_map" and prefix == item_prefix:
+                yield models[item_prefix].model_validate(builder.value)
+                item_prefix, builder = None, None
+        del events[:]
+
+
+class _Endpoints:
+    """Endpoint urls shared by the sync and async adapters."""
+
+    url: str
+
+    def _set_url(self, url: str) -> None:
+        """Set the gateway url and precompute the fixed endpoint urls."""
+        self.url = url
+        self._url_create_dir = url + "/storage/directory/create"
+        self._url_upload = url + "/storage/upload/"
+        self._url_download = url + "/storage/download/"
+        self._url_list = {
+            "public": url + "/storage/list/public",
+            "private": url + "/storage/list/private",
+        }
+
+    def _lsdir_url(self, path: list[str] | None, private: bool) -> str:
+        """Get the listing url for a directory path."""
+        if path is None:
+            return self._url_list["private" if private else "public"]
+
+        path_list = "/".join(path)
+        return self.url + f"/storage/directory/{path_list}/list"
+
+
+class IagonAdapter(_Endpoints):
     """Low level Python interface to Python."""
 
     url = "https://gw.v109.iagon.com/api/v2"
     json_header: dict
     auth_header: dict
-    timeout: int
+    timeout: Timeout
+    transfer_timeout: Timeout
+    _session: requests.Session | HttpxSession
 
-    def __init__(self, token: str | None = None, timeout: int = 60) -> None:
+    def __init__(
+        self,
+        token: str | None = None,
+        timeout: Timeout = _DEFAULT_TIMEOUT,
+        transfer_timeout: Timeout = _DEFAULT_TRANSFER_TIMEOUT,
+        transport: Literal["requests", "httpx"] = "requests",
+    ) -> None:
         """Create an Iagon object with an active auth token.
 
         Args:
             token: Active auth token. Defaults to None.
-            timeout: Request timeouts.
+            timeout: Timeout for api calls, in seconds. Either a single value or a
+                (connect, read) pair. Defaults to (5, 30).
+            transfer_timeout: Timeout for file uploads and downloads. A read timeout
+                of None waits indefinitely, so large transfers on slow links do not
+                fail. Defaults to (5, None).
+            transport: The http client to use. "httpx" uses HTTP/2, multiplexing
+                concurrent calls over one connection, and requires the optional
+                `httpx` dependency. Defaults to "requests".
         """
         self.token = token
 
@@ -130,31 +598,96 @@ class IagonAdapter:
         }
 
         self.timeout = timeout
+        self.transfer_timeout = transfer_timeout
+
+        self._set_url(self.url)
+
+        if transport == "httpx":
+            self._session = _httpx_session()
+        elif transport == "requests":
+            self._session = _create_session()
+        else:
+            msg = f"Unknown transport: {transport}"
+            raise ValueError(msg)
+        self._session.headers.update(self.auth_header)
+
+        # Uploads and directory creation are not idempotent, and upload bodies are
+        # streamed and cannot be rewound, so only retry failures to connect, which
+        # happen before anything is sent
+        no_resend = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=_MAX_RETRIES,
+                connect=_MAX_RETRIES,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=_BACKOFF_FACTOR,
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount(self._url_upload, no_resend)
+        self._session.mount(self._url_create_dir, no_resend)
+
+    def close(self) -> None:
+        """Close the underlying http session and release pooled connections."""
+        self._session.close()
+
+    @contextmanager
+    def with_timeout(
+        self,
+        timeout: Timeout | None = None,
+        transfer_timeout: Timeout | None = None,
+    ) -> Generator[IagonAdapter, None, None]:
+        """Temporarily override request timeouts. Use in a context block.
+
+        Args:
+            timeout: Timeout for api calls. If None, left unchanged. Defaults to None.
+            transfer_timeout: Timeout for file uploads and downloads. If None, left
+                unchanged. Defaults to None.
+
+        Yields:
+            This adapter, with the overridden timeouts.
+        """
+        previous = self.timeout, self.transfer_timeout
+        if timeout is not None:
+            self.timeout = timeout
+        if transfer_timeout is not None:
+            self.transfer_timeout = transfer_timeout
+
+        try:
+            yield self
+        finally:
+            self.timeout, self.transfer_timeout = previous
 
     @classmethod
-    def nonce(cls, address: str) -> str:
+    def nonce(cls, address: str, timeout: Timeout = _DEFAULT_TIMEOUT) -> str:
         """Request a nonce for authorization.
 
         Args:
             address: A bech32 address.
+            timeout: Timeout for the request. Defaults to (5, 30).
 
         Returns:
             A nonce.
         """
-        response = requests.post(
+        response = _public_session().post(
             cls.url + "/public/nonce",
             data={"publicAddress": address},
-            timeout=10,
+            timeout=timeout,
         )
 
-        if response.status_code != requests.codes["ok"]:
-            msg = f"Error: {response.json()['message']}"
-            raise BadRequestError(msg)
-
-        return response.json()["nonce"]
+        return _parse_response(response.status_code, response.content)["nonce"]
 
     @classmethod
-    def verify(cls, address: str, signature: str, key: str) -> str:
+    def verify(
+        cls,
+        address: str,
+        signature: str,
+        key: str,
+        timeout: Timeout = _DEFAULT_TIMEOUT,
+    ) -> str:
         """Verify CIP8 signed nonce and request auth token.
 
         Iagon generates an auth token based on verification of a signed nonce using
@@ -169,26 +702,59 @@ class IagonAdapter:
             address: A bech32 address.
             signature: A CIP8 signature.
             key: A CIP8 key.
+            timeout: Timeout for the request. Defaults to (5, 30).
 
         Returns:
             An auth token.
         """
-        response = requests.post(
+        response = _public_session().post(
             cls.url + "/public/verify",
             data={"publicAddress": address, "signature": signature, "key": key},
-            timeout=10,
+            timeout=timeout,
         )
-        if response.status_code != requests.codes["ok"]:
-            msg = f"Error: {response.json()['message']}"
-            raise BadRequestError(msg)
 
-        return response.json()["session"]
+        return _parse_response(response.status_code, response.content)["session"]
+
+    @classmethod
+    def _login(cls, seed: str, timeout: Timeout = _DEFAULT_TIMEOUT) -> str:
+        """Request a new auth token by signing a nonce with the wallet's stake key.
+
+        Args:
+            seed: A seed phrase for a wallet.
+            timeout: Timeout for each login request. Defaults to (5, 30).
+
+        Returns:
+            An auth token.
+        """
+        # Get the first address and stake key of the wallet
+        address, stake_key = _derive_session_identity(seed)
+
+        # Sign the nonce with CIP8
+        nonce = cls.nonce(address, timeout=timeout)
+        signed_nonce = sign(
+            message=nonce,
+            signing_key=stake_key,
+            attach_cose_key=True,
+        )
+
+        # Request an auth token
+        return cls.verify(
+            address=address,
+            signature=signed_nonce["signature"],
+            key=signed_nonce["key"],
+            timeout=timeout,
+        )
 
     @classmethod
     @contextmanager
-    def session(
+    def session(  # noqa: PLR0913
         cls,
         seed: str,
+        cache_token: bool = True,
+        token_ttl: float = _TOKEN_TTL,
+        timeout: Timeout = _DEFAULT_TIMEOUT,
+        transfer_timeout: Timeout = _DEFAULT_TRANSFER_TIMEOUT,
+        transport: Literal["requests", "httpx"] = "requests",
     ) -> Generator[IagonAdapter, None, None]:
         """Create an Iagon session. Use in a context block.
 
@@ -199,56 +765,63 @@ class IagonAdapter:
         address in the wallet. The session is valid within the context block, and then
         is properly cleaned up upon exit.
 
+        Auth tokens are cached in memory per seed phrase, so opening several sessions
+        with the same seed skips wallet derivation and the nonce/verify round trips
+        until the token expires. A cached token is discarded if Iagon rejects it.
+
         Todo:
             See TODOs in code. A number of Iagon endpoints do not function correctly.
             Currently cannot verify or disconnect properly.
 
         Args:
             seed: A seed phrase for a wallet.
+            cache_token: If True, reuse a cached auth token for this seed when one is
+                available. Defaults to True.
+            token_ttl: Seconds a newly acquired token is cached for. Defaults to 30
+                minutes.
+            timeout: Timeout for api calls, including login. See `IagonAdapter`.
+                Defaults to (5, 30).
+            transfer_timeout: Timeout for file uploads and downloads. See
+                `IagonAdapter`. Defaults to (5, None).
+            transport: The http client to use. See `IagonAdapter`. Defaults to
+                "requests".
 
         Yields:
             An IagonAdapter with a live session token.
         """
-        # Generate the wallet and first address
-        hdwallet = HDWallet.from_mnemonic(seed)
-        hdwallet_spend = hdwallet.derive_from_path("m/1852'/1815'/0'/0/0")
-        hdwallet_stake = hdwallet.derive_from_path("m/1852'/1815'/0'/2/0")
-        pay_key = PaymentExtendedSigningKey.from_hdwallet(hdwallet_spend)
-        stake_key = StakeExtendedSigningKey.from_hdwallet(hdwallet_stake)
-        address = Address(
-            payment_part=pay_key.to_verification_key().hash(),
-            staking_part=stake_key.to_verification_key().hash(),
-        ).to_cbor_hex()[4:]
+        cache_key = _token_cache_key(seed)
+        cached = _TOKEN_CACHE.get(cache_key) if cache_token else None
 
-        # Sign the nonce with CIP8
-        nonce = cls.nonce(address)
-        signed_nonce = sign(
-            message=nonce,
-            signing_key=stake_key,
-            attach_cose_key=True,
-        )
-
-        # Request an auth token
-        token = cls.verify(
-            address=address,
-            signature=signed_nonce["signature"],
-            key=signed_nonce["key"],
-        )
+        if cached is not None and time.time() < cached[1]:
+            token = cached[0]
+        else:
+            token = cls._login(seed, timeout=timeout)
+            _TOKEN_CACHE[cache_key] = (token, time.time() + token_ttl)
 
         # Create the Iagon session adapter
-        adapter = IagonAdapter(token)
+        adapter = cls(
+            token,
+            timeout=timeout,
+            transfer_timeout=transfer_timeout,
+            transport=transport,
+        )
 
         # TODO: Right now this endpoint times out. Uncomment when fixed.
 
-        yield adapter
+        try:
+            yield adapter
+        except NotAuthenticatedError:
+            _TOKEN_CACHE.pop(cache_key, None)
+            raise
+        finally:
+            # TODO: Right now this endpoint times out. Uncomment when fixed.
 
-        # TODO: Right now this endpoint times out. Uncomment when fixed.
+            adapter.close()
 
     def check_auth(self) -> bool:
         """Check if session is live. Currently does not work."""
-        raw_response = requests.post(
+        raw_response = self._session.post(
             self.url + "/public/checkauth",
-            headers=self.auth_header,
             timeout=self.timeout,
         )
         response = self.handle_response(raw_response)
@@ -257,28 +830,15 @@ class IagonAdapter:
 
     def disconnect(self) -> None:
         """Request auth token expiration. Currently does not work."""
-        raw_response = requests.post(
+        raw_response = self._session.post(
             self.url + "/public/disconnect",
-            headers=self.auth_header,
             timeout=self.timeout,
         )
         self.handle_response(raw_response)
 
-    def handle_response(self, response: requests.Response) -> dict:
+    def handle_response(self, response: requests.Response | HttpxResponse) -> dict:
         """Response handler. Gateway for more informative error messaging."""
-        if response.status_code == requests.codes["bad"]:
-            raise BadRequestError(response.json()["message"])
-        elif response.status_code == requests.codes["unauthorized"]:  # noqa: RET506
-            raise NotAuthenticatedError(response.json()["message"])
-        elif response.status_code == requests.codes["not_found"]:
-            raise NotFoundError(response.json()["message"])
-        elif response.status_code == requests.codes["conflict"]:
-            raise DirectoryExistsError(response.text)
-        elif response.status_code != requests.codes["ok"]:
-            msg = f"Error {response.status_code}: {response.text}"
-            raise BadRequestError(msg)
-
-        return response.json()
+        return _parse_response(response.status_code, response.content)
 
     def create_directory(
         self,
@@ -298,10 +858,9 @@ class IagonAdapter:
         Returns:
             Information about the newly created directory.
         """
-        raw_response = requests.post(
-            self.url + "/storage/directory/create",
-            data=json.dumps({"directory_name": name, "parent_directory_id": parent_id}),
-            headers=self.json_header,
+        raw_response = self._session.post(
+            self._url_create_dir,
+            json={"directory_name": name, "parent_directory_id": parent_id},
             timeout=self.timeout,
         )
         response = self.handle_response(raw_response)
@@ -310,7 +869,7 @@ class IagonAdapter:
     def upload(  # noqa: PLR0913
         self,
         file_name: str,
-        file: bytes,
+        file: bytes | bytearray | memoryview | str | Path | BinaryIO,
         private: bool = True,
         password: str = "default",  # noqa: S107
         dir_id: str | None = None,
@@ -320,9 +879,14 @@ class IagonAdapter:
 
         Upload a new file to Iagon. Can be public or private.
 
+        The file is streamed in chunks rather than read into memory, behind form
+        fields that are encoded once and reused across uploads. Non-seekable file
+        objects have no known length, so they are read into memory before sending.
+
         Args:
             file_name: Name of file to upload.
-            file: Byte stream of data to upload.
+            file: Data to upload. Can be raw bytes or another bytes-like buffer, a
+                path to a file, or a readable binary file object.
             private: If true, file is only visible to the wallet address.
                 Defaults to True.
             password: Password for encrypting the file. This must be a valid string.
@@ -334,23 +898,29 @@ class IagonAdapter:
         Returns:
             The Id of the newly created file.
         """
-        # Configure upload parameters
-        visibility = "private" if private else "public"
-        data = {"filename": file_name, "password": password, "visibility": visibility}
-        if dir_id is not None:
-            data.update(directoryId=dir_id)
-        if region_id is not None:
-            data.update(regionId=region_id)
-        files = {"file": (file_name, file)}
-
-        # Send the file
-        raw_response = requests.post(
-            self.url + "/storage/upload/",
-            data=data,
-            files=files,
-            headers=self.auth_header,
-            timeout=self.timeout,
-        )
+        with ExitStack() as stack:
+            fh = _open_source(file, stack)
+            size = _remaining_size(fh)
+
+            # Non-seekable streams have no known length, so buffer them first
+            if size is None:
+                content = fh.read()
+                fh, size = io.BytesIO(content), len(content)
+
+            # Send the file
+            body = _MultipartBody(
+                file_name,
+                _multipart_field("password", password)
+                + _multipart_fields(private, dir_id, region_id),
+                fh,
+                size,
+            )
+            raw_response = self._session.post(
+                self._url_upload,
+                data=body,
+                headers={"Content-Type": body.content_type},
+                timeout=self.transfer_timeout,
+            )
 
         # Validate the response
         response = self.handle_response(raw_response)
@@ -372,13 +942,144 @@ class IagonAdapter:
         Returns:
             The raw bytes of the data.
         """
-        raw_response = requests.post(
-            self.url + "/storage/download/",
+        buffer = io.BytesIO()
+        self.download_to(file_id, buffer, password=password)
+
+        return buffer.getvalue()
+
+    def download_to(
+        self,
+        file_id: str,
+        dst: str | Path | BinaryIO,
+        password: str = "default",  # noqa: S107
+        chunk_size: int = 1 << 20,
+    ) -> None:
+        """Download a file, streaming it to a path or file object.
+
+        The file is written in chunks as it arrives, so memory usage is bounded by
+        `chunk_size` rather than the size of the file.
+
+        Args:
+            file_id: The id of the file to download.
+            dst: A file path, or a writable binary file object.
+            password: The password to decrypt the file. Must match the upload password.
+                Defaults to "default".
+            chunk_size: Number of bytes to read per chunk. Defaults to 1 MiB.
+        """
+        raw_response = self._session.post(
+            self._url_download,
             data={"id": file_id, "password": password},
-            headers=self.auth_header,
-            timeout=self.timeout,
+            timeout=self.transfer_timeout,
+            stream=True,
         )
-        return raw_response.content
+
+        with raw_response:
+            if raw_response.status_code != _HTTP_OK:
+                self.handle_response(raw_response)
+
+            if isinstance(dst, (str, Path)):
+                with Path(dst).open("wb") as fw:
+                    for chunk in raw_response.iter_content(chunk_size):
+                        fw.write(chunk)
+            else:
+                for chunk in raw_response.iter_content(chunk_size):
+                    dst.write(chunk)
+
+    def upload_many(  # noqa: PLR0913
+        self,
+        items: Iterable[tuple[str, bytes | bytearray | memoryview | str | Path]],
+        private: bool = True,
+        password: str = "default",  # noqa: S107
+        dir_id: str | None = None,
+        region_id: str | None = None,
+        concurrency: int = 8,
+    ) -> list[FileId]:
+        """Upload many files concurrently.
+
+        Uploads are run concurrently on an event loop through an `AsyncIagonAdapter`,
+        with at most `concurrency` requests in flight at once. Uploads that fail to
+        connect are retried with exponential backoff, but gateway errors are not, as
+        the file may already have been stored. Requires the optional `aiohttp`
+        dependency, and cannot be called from within a running event loop.
+
+        Args:
+            items: Pairs of file name and data to upload. Data can be raw bytes or
+                another bytes-like buffer, or a path to a file, which is streamed from
+                disk.
+            private: If true, files are only visible to the wallet address.
+                Defaults to True.
+            password: Password for encrypting the files. Defaults to "default".
+            dir_id: The directory id to place the files. If None, places in the
+                root folder. Defaults to None.
+            region_id: The region id for routing file uploads. Defaults to None.
+            concurrency: Maximum number of simultaneous uploads. Lower this on slow
+                networks. Defaults to 8.
+
+        Returns:
+            The Ids of the newly created files, in the same order as `items`.
+        """
+
+        async def _gather() -> list[FileId]:
+            sem = asyncio.Semaphore(concurrency)
+
+            async with _async_adapter(self, concurrency) as adapter:
+
+                async def _upload(
+                    file_name: str,
+                    file: bytes | bytearray | memoryview | str | Path,
+                ) -> FileId:
+                    async with sem:
+                        return await adapter.upload(
+                            file_name,
+                            file,
+                            private=private,
+                            password=password,
+                            dir_id=dir_id,
+                            region_id=region_id,
+                        )
+
+                return await asyncio.gather(
+                    *(_upload(file_name, file) for file_name, file in items),
+                )
+
+        return asyncio.run(_gather())
+
+    def download_many(
+        self,
+        file_ids: Iterable[str],
+        password: str = "default",  # noqa: S107
+        concurrency: int = 8,
+    ) -> list[bytes]:
+        """Download many files concurrently.
+
+        Downloads are run concurrently on an event loop through an
+        `AsyncIagonAdapter`, with at most `concurrency` requests in flight at once.
+        Requires the optional `aiohttp` dependency, and cannot be called from within
+        a running event loop.
+
+        Args:
+            file_ids: The ids of the files to download.
+            password: The password to decrypt the files. Must match the upload
+                password. Defaults to "default".
+            concurrency: Maximum number of simultaneous downloads. Lower this on slow
+                networks. Defaults to 8.
+
+        Returns:
+            The raw bytes of each file, in the same order as `file_ids`.
+        """
+
+        async def _gather() -> list[bytes]:
+            sem = asyncio.Semaphore(concurrency)
+
+            async with _async_adapter(self, concurrency) as adapter:
+
+                async def _download(file_id: str) -> bytes:
+                    async with sem:
+                        return await adapter.download(file_id, password=password)
+
+                return await asyncio.gather(*map(_download, file_ids))
+
+        return asyncio.run(_gather())
 
     def lsdir(
         self,
@@ -395,23 +1096,91 @@ class IagonAdapter:
         Returns:
             An object containing files and folders in the directory.
         """
-        permission = "private" if private else "public"
+        raw_response = self._session.get(
+            self._lsdir_url(path, private),
+            timeout=self.timeout,
+        )
+        if raw_response.status_code != _HTTP_OK:
+            self.handle_response(raw_response)
 
-        if path is None:
-            raw_response = requests.get(
-                self.url + f"/storage/list/{permission}",
-                headers=self.json_header,
-                timeout=self.timeout,
-            )
-        else:
-            path_list = "/".join(path)
-            raw_response = requests.get(
-                self.url + f"/storage/directory/{path_list}/list",
-                headers=self.json_header,
-                timeout=self.timeout,
-            )
-        response = self.handle_response(raw_response)
-        return ListSuccess.model_validate(response)
+        # Validate straight from the raw json, skipping the intermediate dict
+        return ListSuccess.model_validate_json(raw_response.content)
+
+    def lsdir_fast(
+        self,
+        path: list[str] | None = None,
+        private: bool = False,
+    ) -> structs.FastListSuccess:
+        """List of files and folders in the directory, decoded with msgspec.
+
+        This is a faster alternative to `lsdir` for very large directories. The
+        response is decoded directly into slotted `msgspec` structs, skipping both
+        the intermediate dict and pydantic validation. Requires the optional
+        `msgspec` dependency.
+
+        Args:
+            path: A list of folder ids defining the path to the folder. If None, lists
+                files and folders in the root directory. Defaults to None.
+            private: If True, displays private files. Defaults to False.
+
+        Returns:
+            An object containing files and folders in the directory.
+        """
+        if structs is None:
+            msg = "msgspec is required for lsdir_fast: pip install iagon-py[speedups]"
+            raise ImportError(msg)
+
+        raw_response = self._session.get(
+            self._lsdir_url(path, private),
+            timeout=self.timeout,
+        )
+        if raw_response.status_code != _HTTP_OK:
+            self.handle_response(raw_response)
+
+        return structs.LIST_SUCCESS_DECODER.decode(raw_response.content)
+
+    def iter_lsdir(
+        self,
+        path: list[str] | None = None,
+        private: bool = False,
+        chunk_size: int = 1 << 16,
+    ) -> Iterator[FileInfo | DirectoryInfo]:
+        """Iterate over the files and folders in a directory.
+
+        The Iagon api does not paginate directory listings, so the response is
+        streamed instead. When the optional `ijson` dependency is installed, entries
+        are parsed and validated one at a time as the response arrives, so memory
+        use does not grow with the size of the directory and breaking out early stops
+        the download. Without `ijson`, the response is read in full but entries are
+        still validated lazily.
+
+        Entries are yielded in the order they appear in the response.
+
+        Args:
+            path: A list of folder ids defining the path to the folder. If None, lists
+                files and folders in the root directory. Defaults to None.
+            private: If True, displays private files. Defaults to False.
+            chunk_size: Number of bytes to read per chunk. Defaults to 64 KiB.
+
+        Yields:
+            Information about each file and folder in the directory.
+        """
+        raw_response = self._session.get(
+            self._lsdir_url(path, private),
+            timeout=self.timeout,
+            stream=True,
+        )
+
+        with raw_response:
+            if ijson is None or raw_response.status_code != _HTTP_OK:
+                data = self.handle_response(raw_response)["data"]
+                for key, entries in data.items():
+                    model = _LISTING_MODELS.get(key)
+                    if model is not None:
+                        yield from map(model.model_validate, entries)
+                return
+
+            yield from _iter_listing(raw_response.iter_content(chunk_size))
 
     def delete_directory(self, dir_id: str) -> Success:
         """Delete a directory.
@@ -424,9 +1193,8 @@ class IagonAdapter:
         Returns:
             A success message, or an error if deletion was unsuccessful.
         """
-        raw_response = requests.delete(
+        raw_response = self._session.delete(
             self.url + f"/storage/directory/{dir_id}",
-            headers=self.json_header,
             timeout=self.timeout,
         )
         response = self.handle_response(raw_response)
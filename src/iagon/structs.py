@@ -0,0 +1,67 @@
+"""Lightweight msgspec structs for decoding large Iagon listings.
+
+These mirror the pydantic models in `iagon.base`, but decode straight from json
+bytes into slotted objects. They require the optional `msgspec` dependency.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import msgspec
+
+
+class FastFileInfo(
+    msgspec.Struct,
+    kw_only=True,
+    rename={"file_id": "_id", "file_hash": "hash", "v": "__v"},
+):
+    """File or chunk information."""
+
+    file_id: str
+    wallet_id: str
+    parent_directory_id: str | None = None
+    file_hash: str | None = None
+    name: str
+    ext: str | None = None
+    file_size_byte_native: int
+    file_size_byte_encrypted: int | None = None
+    encrypted_symmetric_key: str | None = None
+    resource_provider_id: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    v: int
+
+
+class FastDirectoryInfo(
+    msgspec.Struct,
+    kw_only=True,
+    rename={"dir_id": "_id", "v": "__v"},
+):
+    """Directory information."""
+
+    dir_id: str
+    directory_name: str
+    parent_directory_id: str | None
+    wallet_id: str
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    v: int
+
+
+class FastListResponse(msgspec.Struct):
+    """Directory list information. Contains both files and folders."""
+
+    files: list[FastFileInfo]
+    directories: list[FastDirectoryInfo]
+
+
+class FastListSuccess(msgspec.Struct):
+    """Successful list directory response."""
+
+    success: bool
+    data: FastListResponse
+    message: str | None = None
+
+
+LIST_SUCCESS_DECODER = msgspec.json.Decoder(FastListSuccess)
@@ -0,0 +1,157 @@
+"""An HTTP/2 capable transport for `IagonAdapter`, built on httpx.
+
+`HttpxSession` exposes the small subset of the `requests.Session` interface that
+`IagonAdapter` uses, so the adapter can swap transports without changing any of its
+calls. With HTTP/2, concurrent calls are multiplexed over a single connection rather
+than opening one connection per request. It requires the optional `httpx` dependency
+with its `http2` extra.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from types import TracebackType
+from typing import TYPE_CHECKING
+from typing import Any
+
+import httpx
+
+from .base import _MAX_RETRIES
+from .base import Timeout
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+def _httpx_timeout(timeout: Timeout | None) -> httpx.Timeout:
+    """Convert a requests style timeout to an httpx timeout."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+
+    return httpx.Timeout(timeout)
+
+
+class HttpxResponse:
+    """A `requests.Response` lookalike wrapping an `httpx.Response`."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        """Wrap an httpx response.
+
+        Args:
+            response: The httpx response, which may still be streaming.
+        """
+        self._response = response
+
+    @property
+    def status_code(self) -> int:
+        """The response status code."""
+        return self._response.status_code
+
+    @property
+    def content(self) -> bytes:
+        """The response body, read in full if it is still streaming."""
+        return self._response.read()
+
+    @property
+    def text(self) -> str:
+        """The response body as text."""
+        self._response.read()
+        return self._response.text
+
+    def iter_content(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        """Iterate over the decoded response body in chunks."""
+        return self._response.iter_bytes(chunk_size)
+
+    def close(self) -> None:
+        """Release the connection back to the pool."""
+        self._response.close()
+
+    def __enter__(self) -> Self:
+        """Use the response in a context block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the response on exiting the context block."""
+        self.close()
+
+
+class HttpxSession:
+    """A `requests.Session` lookalike backed by an HTTP/2 `httpx.Client`."""
+
+    def __init__(self, http2: bool = True) -> None:
+        """Create a pooled httpx client.
+
+        Args:
+            http2: If True, negotiate HTTP/2 with servers that support it. Defaults
+                to True.
+        """
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=http2,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                retries=_MAX_RETRIES,
+            ),
+        )
+
+    @property
+    def headers(self) -> httpx.Headers:
+        """Headers sent with every request."""
+        return self._client.headers
+
+    def mount(self, prefix: str, adapter: Any) -> None:  # noqa: ANN401
+        """Ignore `requests` transport adapters, which do not apply to httpx."""
+
+    def request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        data: Any = None,  # noqa: ANN401
+        json: Any = None,  # noqa: ANN401
+        headers: dict | None = None,
+        timeout: Timeout | None = None,
+        stream: bool = False,
+    ) -> HttpxResponse:
+        """Send a request using `requests` style arguments.
+
+        Request bodies exposing `read` and `len`, such as pre-encoded multipart
+        uploads, are streamed with a known content length.
+        """
+        content = None
+        if hasattr(data, "read") and hasattr(data, "len"):
+            encoder, data = data, None
+            headers = {**(headers or {}), "Content-Length": str(encoder.len)}
+            content = iter(lambda: encoder.read(1 << 16), b"")
+
+        request = self._client.build_request(
+            method,
+            url,
+            content=content,
+            data=data,
+            json=json,
+            headers=headers,
+            timeout=_httpx_timeout(timeout),
+        )
+
+        return HttpxResponse(self._client.send(request, stream=stream))
+
+    def get(self, url: str, **kwargs: Any) -> HttpxResponse:  # noqa: ANN401
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> HttpxResponse:  # noqa: ANN401
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> HttpxResponse:  # noqa: ANN401
+        """Send a DELETE request."""
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close the client and release pooled connections."""
+        self._client.close()
@@ -0,0 +1,106 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+from iagon import IagonAdapter
+
+
+@pytest.fixture()
+def file_info():
+    def factory(file_id, name=None, **fields):
+        return {
+            "_id": file_id,
+            "wallet_id": "wallet",
+            "parent_directory_id": None,
+            "hash": "hash",
+            "name": name or f"{file_id}.txt",
+            "file_size_byte_native": 12,
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "__v": 0,
+            **fields,
+        }
+
+    return factory
+
+
+@pytest.fixture()
+def directory_info():
+    def factory(dir_id, name=None, **fields):
+        return {
+            "_id": dir_id,
+            "directory_name": name or dir_id,
+            "parent_directory_id": None,
+            "wallet_id": "wallet",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "__v": 0,
+            **fields,
+        }
+
+    return factory
+
+
+@pytest.fixture(params=["requests", "httpx"])
+def transport(request):
+    if request.param == "httpx":
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+    return request.param
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    def handle_request(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        self.server.requests.append((self.command, self.path, self.headers, body))
+
+        responses = self.server.routes.get(self.path, [(404, {"message": "nope"})])
+        status, content = responses.pop(0) if len(responses) > 1 else responses[0]
+        if not isinstance(content, bytes):
+            content = json.dumps(content).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_DELETE = handle_request
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeHandler)
+        self.requests = []
+        self.routes = {}
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}/api/v2"
+
+    def route(self, path, *responses):
+        self.routes["/api/v2" + path] = list(responses)
+
+    def hits(self, path):
+        return [r for r in self.requests if r[1] == "/api/v2" + path]
+
+
+@pytest.fixture()
+def server(monkeypatch):
+    server = FakeServer()
+    monkeypatch.setattr(IagonAdapter, "url", server.url)
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={"poll_interval": 0.01},
+        daemon=True,
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
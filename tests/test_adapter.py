@@ -44,7 +44,7 @@ async def test_folders(seed, folder_name, subfolder_name):
 
         lsdir: ListSuccess = adapter.lsdir(private=True)
 
-        assert folder_name in [d.directory_name for d in lsdir.data.directories]
+        assert folder_name in lsdir.data.directory_names
 
         # Create subfolder
         subfolder = adapter.create_directory(
@@ -53,21 +53,21 @@ async def test_folders(seed, folder_name, subfolder_name):
 
         lsdir = adapter.lsdir(path=[folder.dir_id], private=True)
 
-        assert subfolder_name in [d.directory_name for d in lsdir.data.directories]
+        assert subfolder_name in lsdir.data.directory_names
 
         # Cleanup the subfolder
         adapter.delete_directory(subfolder.dir_id)
 
         lsdir = adapter.lsdir(path=[folder.dir_id], private=True)
 
-        assert subfolder_name not in [d.directory_name for d in lsdir.data.directories]
+        assert subfolder_name not in lsdir.data.directory_names
 
         # Cleanup the base folder
         adapter.delete_directory(folder.dir_id)
 
         lsdir = adapter.lsdir(private=True)
 
-        assert folder_name not in [d.directory_name for d in lsdir.data.directories]
+        assert folder_name not in lsdir.data.directory_names
 
 
 @pytest.mark.order(3)
@@ -79,7 +79,7 @@ async def test_file(seed, folder_name, file_name):
 
         lsdir: ListSuccess = adapter.lsdir(private=True)
 
-        assert folder_name in [d.directory_name for d in lsdir.data.directories]
+        assert folder_name in lsdir.data.directory_names
 
         name, data = file_name
 
@@ -92,7 +92,7 @@ async def test_file(seed, folder_name, file_name):
 
         lsdir: ListSuccess = adapter.lsdir(path=[folder.dir_id], private=True)
 
-        assert upload_file.file_id in [d.file_id for d in lsdir.data.files]
+        assert upload_file.file_id in lsdir.data.file_ids
 
         # Download the file
         download_file = adapter.download(upload_file.file_id)
@@ -104,4 +104,4 @@ async def test_file(seed, folder_name, file_name):
 
         lsdir = adapter.lsdir(private=True)
 
-        assert folder_name not in [d.directory_name for d in lsdir.data.directories]
+        assert folder_name not in lsdir.data.directory_names
@@ -0,0 +1,231 @@
+import asyncio
+import io
+import socket
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+import pytest_asyncio  # noqa: E402
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+from iagon import IagonAdapter  # noqa: E402
+from iagon.aio import AsyncIagonAdapter  # noqa: E402
+from iagon.base import _TOKEN_CACHE  # noqa: E402
+from iagon.base import BadRequestError  # noqa: E402
+from iagon.base import NotFoundError  # noqa: E402
+from pycardano import HDWallet  # noqa: E402
+
+
+class FakeIagon:
+    def __init__(self, listing):
+        self.listing = listing
+        self.requests = []
+        self.files = {}
+        self.delays = {}
+        self.upload_failures = 0
+
+    def record(self, request):
+        self.requests.append((request.path, request.headers.get("Authorization")))
+
+    async def nonce(self, request):
+        self.record(request)
+        assert (await request.post())["publicAddress"]
+        return web.json_response({"success": True, "nonce": "nonce"})
+
+    async def verify(self, request):
+        self.record(request)
+        form = await request.post()
+        assert form["signature"]
+        assert form["key"]
+        return web.json_response({"success": True, "session": "token"})
+
+    async def upload(self, request):
+        self.record(request)
+        if self.upload_failures > 0:
+            self.upload_failures -= 1
+            return web.Response(status=503)
+
+        form = await request.post()
+        self.files[form["filename"]] = form["file"].file.read()
+        return web.json_response({"success": True, "data": {"id": form["filename"]}})
+
+    async def download(self, request):
+        self.record(request)
+        form = await request.post()
+        await asyncio.sleep(self.delays.get(form["id"], 0))
+        if form["id"] not in self.files:
+            return web.json_response({"message": "File not found"}, status=404)
+        return web.Response(body=self.files[form["id"]])
+
+    async def list_public(self, request):
+        self.record(request)
+        return web.json_response(
+            {"success": True, "data": self.listing},
+        )
+
+    def app(self):
+        app = web.Application()
+        app.router.add_post("/api/v2/public/nonce", self.nonce)
+        app.router.add_post("/api/v2/public/verify", self.verify)
+        app.router.add_post("/api/v2/storage/upload/", self.upload)
+        app.router.add_post("/api/v2/storage/download/", self.download)
+        app.router.add_get("/api/v2/storage/list/public", self.list_public)
+        return app
+
+
+@pytest.fixture()
+def fake(file_info):
+    return FakeIagon({"files": [file_info("file")], "directories": []})
+
+
+@pytest_asyncio.fixture()
+async def url(fake, monkeypatch):
+    async with TestServer(fake.app()) as server:
+        url = str(server.make_url("/api/v2"))
+        monkeypatch.setattr(AsyncIagonAdapter, "url", url)
+        yield url
+
+
+@pytest.fixture()
+def seed():
+    _TOKEN_CACHE.clear()
+    yield HDWallet.generate_mnemonic()
+    _TOKEN_CACHE.clear()
+
+
+@pytest.mark.asyncio()
+async def test_login_is_unauthenticated(fake, url, seed):
+    async with AsyncIagonAdapter.session(seed) as adapter:
+        listing = await adapter.lsdir()
+
+    assert [f.file_id for f in listing.data.files] == ["file"]
+    assert fake.requests == [
+        ("/api/v2/public/nonce", None),
+        ("/api/v2/public/verify", None),
+        ("/api/v2/storage/list/public", "Bearer token"),
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_session_forwards_timeouts(fake, url, seed):
+    async with AsyncIagonAdapter.session(
+        seed,
+        timeout=1.0,
+        transfer_timeout=(1.0, 2.0),
+    ) as adapter:
+        assert adapter.timeout == 1.0
+        assert adapter.transfer_timeout == (1.0, 2.0)
+
+
+@pytest.mark.asyncio()
+async def test_cached_token_skips_login(fake, url, seed):
+    async with AsyncIagonAdapter.session(seed):
+        pass
+
+    async with AsyncIagonAdapter.session(seed) as adapter:
+        await adapter.lsdir()
+
+    assert [p for p, _ in fake.requests].count("/api/v2/public/nonce") == 1
+
+
+@pytest.mark.asyncio()
+async def test_upload(fake, url, tmp_path):
+    path = tmp_path / "test.txt"
+    path.write_bytes(b"hello world!")
+
+    async with AsyncIagonAdapter("token") as adapter:
+        file_id = await adapter.upload("test.txt", path)
+        data = await adapter.download(file_id.file_id)
+
+    assert data == b"hello world!"
+
+
+@pytest.mark.asyncio()
+async def test_upload_gateway_error_is_not_retried(fake, url):
+    fake.upload_failures = 1
+
+    async with AsyncIagonAdapter("token") as adapter:
+        with pytest.raises(BadRequestError, match="^Error 503"):
+            await adapter.upload("test.txt", b"hello world!")
+
+    assert [p for p, _ in fake.requests].count("/api/v2/storage/upload/") == 1
+
+
+@pytest.fixture()
+def unreachable(monkeypatch):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        host, port = sock.getsockname()
+    monkeypatch.setattr(AsyncIagonAdapter, "url", f"http://{host}:{port}/api/v2")
+    monkeypatch.setattr("iagon.aio._BACKOFF_FACTOR", 0)
+
+    attempts = []
+    post_upload = AsyncIagonAdapter._post_upload
+
+    async def counted(self, *args):
+        attempts.append(args)
+        return await post_upload(self, *args)
+
+    monkeypatch.setattr(AsyncIagonAdapter, "_post_upload", counted)
+    return attempts
+
+
+@pytest.mark.asyncio()
+async def test_upload_retries_connection_errors(unreachable):
+    async with AsyncIagonAdapter("token") as adapter:
+        with pytest.raises(aiohttp.ClientConnectorError):
+            await adapter.upload("test.txt", b"hello world!")
+
+    assert len(unreachable) == 4
+
+
+@pytest.mark.asyncio()
+async def test_upload_file_object_is_not_retried(unreachable):
+    async with AsyncIagonAdapter("token") as adapter:
+        with pytest.raises(aiohttp.ClientConnectorError):
+            await adapter.upload("test.txt", io.BytesIO(b"hello world!"))
+
+    assert len(unreachable) == 1
+
+
+@pytest.mark.asyncio()
+async def test_download_to(fake, url, tmp_path):
+    fake.files["file"] = b"x" * 100_000
+
+    async with AsyncIagonAdapter("token") as adapter:
+        await adapter.download_to("file", tmp_path / "out.bin", chunk_size=1024)
+
+        with pytest.raises(NotFoundError, match="File not found"):
+            await adapter.download_to("missing", tmp_path / "missing.bin")
+
+    assert (tmp_path / "out.bin").read_bytes() == fake.files["file"]
+    assert not (tmp_path / "missing.bin").exists()
+
+
+@pytest.mark.asyncio()
+async def test_bulk_transfers_keep_order(fake, url, monkeypatch):
+    monkeypatch.setattr(IagonAdapter, "url", url)
+    items = [(f"file{i}", bytes([i]) * (i + 1)) for i in range(20)]
+    fake.delays = {name: (20 - i) / 1000 for i, (name, _) in enumerate(items)}
+    adapter = IagonAdapter("token")
+
+    # The bulk api runs its own event loop, so call it from a worker thread
+    file_ids = await asyncio.to_thread(adapter.upload_many, items, concurrency=4)
+    ids = [file_id.file_id for file_id in file_ids]
+    data = await asyncio.to_thread(adapter.download_many, ids, concurrency=4)
+    adapter.close()
+
+    assert ids == [name for name, _ in items]
+    assert data == [content for _, content in items]
+
+
+@pytest.mark.asyncio()
+async def test_bulk_download_error_is_raised(fake, url, monkeypatch):
+    monkeypatch.setattr(IagonAdapter, "url", url)
+    fake.files["file"] = b"hello world!"
+    adapter = IagonAdapter("token")
+
+    with pytest.raises(NotFoundError, match="^File not found$"):
+        await asyncio.to_thread(adapter.download_many, ["file", "missing"])
+    adapter.close()
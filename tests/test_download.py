@@ -0,0 +1,45 @@
+import io
+
+import pytest
+from iagon import IagonAdapter
+from iagon.base import NotFoundError
+
+
+@pytest.fixture()
+def adapter(server, transport):
+    server.route("/storage/download/", (200, b"x" * 100_000))
+    adapter = IagonAdapter("token", transport=transport)
+    yield adapter
+    adapter.close()
+
+
+def test_download(server, adapter):
+    assert adapter.download("file", password="secret") == b"x" * 100_000
+
+    [(_, _, _, body)] = server.hits("/storage/download/")
+    assert body == b"id=file&password=secret"
+
+
+def test_download_to_path(adapter, tmp_path):
+    adapter.download_to("file", tmp_path / "out.bin", chunk_size=1024)
+
+    assert (tmp_path / "out.bin").read_bytes() == b"x" * 100_000
+
+
+def test_download_to_file_object(adapter):
+    buffer = io.BytesIO()
+    adapter.download_to("file", buffer, chunk_size=1024)
+
+    assert buffer.getvalue() == b"x" * 100_000
+
+
+def test_download_error_is_raised(server, adapter, tmp_path):
+    server.route("/storage/download/", (404, {"message": "File not found"}))
+
+    with pytest.raises(NotFoundError, match="^File not found$"):
+        adapter.download("missing")
+
+    with pytest.raises(NotFoundError, match="^File not found$"):
+        adapter.download_to("missing", tmp_path / "missing.bin")
+
+    assert not (tmp_path / "missing.bin").exists()
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+from iagon.base import DirectoryInfo
+from iagon.base import FileInfo
+from iagon.base import _iter_listing
+
+pytest.importorskip("ijson")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_document_order(chunk_size, file_info, directory_info):
+    nested = {"files": [{"_id": "not an entry"}]}
+    body = json.dumps(
+        {
+            "success": True,
+            "data": {
+                "directories": [directory_info("d1"), directory_info("d2")],
+                "files": [file_info(f, nested=nested) for f in ("f1", "f2", "f3")],
+            },
+        },
+    ).encode()
+    chunks = (body[i : i + chunk_size] for i in range(0, len(body), chunk_size))
+
+    entries = list(_iter_listing(chunks))
+
+    assert [type(entry) for entry in entries] == [DirectoryInfo] * 2 + [FileInfo] * 3
+    assert [entry.dir_id for entry in entries[:2]] == ["d1", "d2"]
+    assert [entry.file_id for entry in entries[2:]] == ["f1", "f2", "f3"]
+
+
+def test_empty_listing():
+    body = b'{"success": true, "data": {"files": [], "directories": []}}'
+
+    assert list(_iter_listing([body])) == []
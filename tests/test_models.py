@@ -0,0 +1,47 @@
+import pytest
+from iagon.base import DirectoryInfo
+from iagon.base import ListResponse
+from pydantic import ValidationError
+
+
+@pytest.fixture()
+def directory(directory_info):
+    def factory(name):
+        return DirectoryInfo.model_validate(directory_info(name))
+
+    return factory
+
+
+def test_directory_names_are_cached(directory):
+    listing = ListResponse(files=[], directories=[directory("a")])
+
+    assert listing.directory_names == {"a"}
+    assert listing.directory_names is listing.directory_names
+
+
+def test_listing_is_immutable(directory):
+    listing = ListResponse(files=[], directories=[directory("a")])
+
+    with pytest.raises(ValidationError):
+        listing.directories = (directory("b"),)
+    with pytest.raises(AttributeError):
+        listing.directories.append(directory("b"))
+
+
+def test_directory_names_follow_copy(directory):
+    listing = ListResponse(files=[], directories=[directory("a")])
+    assert listing.directory_names == {"a"}
+
+    copy = listing.model_copy(update={"directories": (directory("b"),)})
+
+    assert copy.directory_names == {"b"}
+    assert listing.directory_names == {"a"}
+    assert listing.model_copy().directory_names == {"a"}
+
+
+def test_cache_does_not_affect_equality(directory):
+    listing = ListResponse(files=[], directories=[directory("a")])
+    assert listing.directory_names == {"a"}
+
+    assert listing == ListResponse(files=[], directories=[directory("a")])
+    assert set(listing.model_dump()) == {"files", "directories"}
@@ -0,0 +1,138 @@
+import io
+import os
+import re
+from contextlib import ExitStack
+
+import pytest
+from iagon.base import _multipart_field
+from iagon.base import _multipart_fields
+from iagon.base import _MultipartBody
+from iagon.base import _open_source
+from iagon.base import _remaining_size
+
+DATA = os.urandom(100_000)
+
+
+def make_body(file_name, fh, password="default", **form):
+    fields = _multipart_field("password", password) + _multipart_fields(
+        form.get("private", True),
+        form.get("dir_id"),
+        form.get("region_id"),
+    )
+    return _MultipartBody(file_name, fields, fh, _remaining_size(fh))
+
+
+def parse(body, content_type):
+    boundary = content_type.split("; boundary=")[1].encode()
+    first, *parts, last = body.split(b"--" + boundary)
+    assert first == b""
+    assert last == b"--\r\n"
+
+    fields = {}
+    for part in parts:
+        assert part.startswith(b"\r\n")
+        assert part.endswith(b"\r\n")
+        head, content = part[2:-2].split(b"\r\n\r\n", 1)
+        disposition, *headers = head.decode().split("\r\n")
+        name = re.search(r'; name="([^"]*)"', disposition).group(1)
+        filename = re.search(r'; filename="([^"]*)"', disposition)
+        assert name not in fields
+        fields[name] = (content, filename and filename.group(1), headers)
+
+    return fields
+
+
+def test_round_trip():
+    body = make_body(
+        "test.bin",
+        io.BytesIO(DATA),
+        password="secret",
+        private=False,
+        dir_id="dir",
+        region_id="region",
+    )
+
+    fields = parse(body.read(), body.content_type)
+
+    assert {name: value for name, (value, _, _) in fields.items()} == {
+        "password": b"secret",
+        "visibility": b"public",
+        "directoryId": b"dir",
+        "regionId": b"region",
+        "filename": b"test.bin",
+        "file": DATA,
+    }
+    assert fields["file"][1:] == (
+        "test.bin",
+        ["Content-Type: application/octet-stream"],
+    )
+
+
+def test_optional_fields_omitted():
+    body = make_body("test.bin", io.BytesIO(b""))
+
+    fields = parse(body.read(), body.content_type)
+
+    assert set(fields) == {"password", "visibility", "filename", "file"}
+    assert fields["visibility"][0] == b"private"
+    assert fields["file"][0] == b""
+
+
+def test_password_is_not_cached():
+    assert b"secret" not in _multipart_fields(True, None, None)
+
+    body = make_body("test.bin", io.BytesIO(DATA), password="secret")
+
+    assert parse(body.read(), body.content_type)["password"][0] == b"secret"
+
+
+@pytest.fixture(params=["bytes", "path", "partially read file"])
+def source(request, tmp_path):
+    if request.param == "bytes":
+        return DATA, DATA
+
+    path = tmp_path / "test.bin"
+    path.write_bytes(DATA)
+    if request.param == "path":
+        return path, DATA
+
+    fh = path.open("rb")
+    request.addfinalizer(fh.close)
+    fh.read(1234)
+    return fh, DATA[1234:]
+
+
+@pytest.mark.parametrize("read_size", [-1, 7, 1 << 16])
+def test_length(source, read_size):
+    src, expected = source
+
+    with ExitStack() as stack:
+        body = make_body("test.bin", _open_source(src, stack))
+        content = b"".join(iter(lambda: body.read(read_size), b""))
+
+    assert body.len == len(content)
+    assert parse(content, body.content_type)["file"][0] == expected
+
+
+@pytest.mark.parametrize(
+    ("file_name", "quoted"),
+    [
+        ('say "hi".txt', "say %22hi%22.txt"),
+        ("line\r\nbreak.txt", "line%0D%0Abreak.txt"),
+        (
+            'x"\r\nContent-Type: text/html\r\n\r\n.txt',
+            "x%22%0D%0AContent-Type: text/html%0D%0A%0D%0A.txt",
+        ),
+    ],
+)
+def test_file_name_quoting(file_name, quoted):
+    body = make_body(file_name, io.BytesIO(DATA))
+    content = body.read()
+
+    fields = parse(content, body.content_type)
+
+    assert fields["file"][1] == quoted
+    assert fields["file"][2] == ["Content-Type: application/octet-stream"]
+    assert fields["file"][0] == DATA
+    assert fields["filename"][0] == file_name.encode()
+    assert body.len == len(content)
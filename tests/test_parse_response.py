@@ -0,0 +1,71 @@
+import pytest
+from iagon import IagonAdapter
+from iagon.base import BadRequestError
+from iagon.base import DirectoryExistsError
+from iagon.base import NotAuthenticatedError
+from iagon.base import NotFoundError
+from iagon.base import _parse_response
+from pycardano import HDWallet
+
+
+def test_success():
+    assert _parse_response(200, b'{"success": true, "data": [1, 2]}') == {
+        "success": True,
+        "data": [1, 2],
+    }
+
+
+@pytest.mark.parametrize(
+    ("status_code", "error"),
+    [
+        (400, BadRequestError),
+        (401, NotAuthenticatedError),
+        (404, NotFoundError),
+        (409, DirectoryExistsError),
+    ],
+)
+def test_error_message(status_code, error):
+    with pytest.raises(error, match="^went wrong$"):
+        _parse_response(status_code, b'{"success": false, "message": "went wrong"}')
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"<html>Bad Gateway</html>", b'{"success": false}', b"[1, 2]"],
+)
+def test_error_without_message(content):
+    with pytest.raises(NotFoundError) as e:
+        _parse_response(404, content)
+
+    assert str(e.value) == content.decode()
+
+
+def test_unknown_status():
+    with pytest.raises(BadRequestError, match="^Error 502: Bad Gateway$"):
+        _parse_response(502, b"Bad Gateway")
+
+
+def test_invalid_utf8():
+    with pytest.raises(BadRequestError, match="^Error 500: "):
+        _parse_response(500, b"\xff\xfe")
+
+
+def test_nonce_gateway_error(server):
+    server.route("/public/nonce", (502, b"<html>502 Bad Gateway</html>"))
+
+    with pytest.raises(BadRequestError, match="^Error 502: <html>"):
+        IagonAdapter.nonce("address")
+
+
+def test_verify_error_message(server):
+    server.route("/public/verify", (401, {"success": False, "message": "Bad key"}))
+
+    with pytest.raises(NotAuthenticatedError, match="^Bad key$"):
+        IagonAdapter.verify("address", "signature", "key")
+
+
+def test_login(server):
+    server.route("/public/nonce", (200, {"success": True, "nonce": "nonce"}))
+    server.route("/public/verify", (200, {"success": True, "session": "token"}))
+
+    assert IagonAdapter._login(HDWallet.generate_mnemonic()) == "token"
@@ -0,0 +1,58 @@
+import pytest
+from iagon import IagonAdapter
+from iagon.base import BadRequestError
+
+GATEWAY_ERROR = (502, b"<html>502 Bad Gateway</html>")
+
+
+@pytest.fixture()
+def adapter(server, monkeypatch):
+    monkeypatch.setattr("iagon.base._BACKOFF_FACTOR", 0)
+    adapter = IagonAdapter("token")
+
+    # The test server is plain http, so apply the https retry policy to it
+    adapter._session.mount("http://", adapter._session.get_adapter("https://"))
+    yield adapter
+    adapter.close()
+
+
+def test_create_directory_is_not_resent(server, adapter):
+    server.route("/storage/directory/create", GATEWAY_ERROR)
+
+    with pytest.raises(BadRequestError, match="^Error 502"):
+        adapter.create_directory("folder")
+
+    assert len(server.hits("/storage/directory/create")) == 1
+
+
+def test_upload_is_not_resent(server, adapter):
+    server.route("/storage/upload/", GATEWAY_ERROR)
+
+    with pytest.raises(BadRequestError, match="^Error 502"):
+        adapter.upload("test.txt", b"hello world!")
+
+    assert len(server.hits("/storage/upload/")) == 1
+
+
+def test_listing_is_retried(server, adapter):
+    listing = {"success": True, "data": {"files": [], "directories": []}}
+    server.route("/storage/list/public", GATEWAY_ERROR, GATEWAY_ERROR, (200, listing))
+
+    assert adapter.lsdir().data.file_ids == frozenset()
+    assert len(server.hits("/storage/list/public")) == 3
+
+
+def test_download_is_retried(server, adapter):
+    server.route("/storage/download/", GATEWAY_ERROR, (200, b"hello world!"))
+
+    assert adapter.download("file") == b"hello world!"
+    assert len(server.hits("/storage/download/")) == 2
+
+
+def test_delete_gives_up_after_max_retries(server, adapter):
+    server.route("/storage/directory/folder", GATEWAY_ERROR)
+
+    with pytest.raises(BadRequestError, match="^Error 502"):
+        adapter.delete_directory("folder")
+
+    assert len(server.hits("/storage/directory/folder")) == 4
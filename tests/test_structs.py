@@ -0,0 +1,76 @@
+import json
+
+import pytest
+from iagon import IagonAdapter
+from iagon.base import DirectoryInfo
+from iagon.base import FileInfo
+from iagon.base import ListSuccess
+
+structs = pytest.importorskip("iagon.structs")
+
+
+@pytest.fixture()
+def body(file_info, directory_info):
+    return json.dumps(
+        {
+            "success": True,
+            "data": {
+                "files": [
+                    file_info("f1", hash="abc", ext="txt", unknown="ignored"),
+                    file_info("f2", hash=None, parent_directory_id="d1"),
+                ],
+                "directories": [
+                    directory_info("d1", parent_directory_id=None),
+                    directory_info("d2", parent_directory_id="d1", __v=3),
+                ],
+            },
+        },
+    ).encode()
+
+
+def assert_same(fast, model):
+    for field in type(model).model_fields:
+        assert getattr(fast, field) == getattr(model, field), field
+
+
+def test_decoder_matches_models(body):
+    fast = structs.LIST_SUCCESS_DECODER.decode(body)
+    model = ListSuccess.model_validate_json(body)
+
+    assert fast.success is model.success
+    assert len(fast.data.files) == len(model.data.files) == 2
+    assert len(fast.data.directories) == len(model.data.directories) == 2
+    for fast_file, file in zip(fast.data.files, model.data.files):
+        assert_same(fast_file, file)
+    for fast_dir, directory in zip(fast.data.directories, model.data.directories):
+        assert_same(fast_dir, directory)
+
+
+def test_renamed_fields(body):
+    fast = structs.LIST_SUCCESS_DECODER.decode(body)
+    first_file, second_file = fast.data.files
+    first_dir, second_dir = fast.data.directories
+
+    assert (first_file.file_id, first_file.file_hash, first_file.v) == ("f1", "abc", 0)
+    assert second_file.file_hash is None
+    assert (first_dir.dir_id, first_dir.parent_directory_id) == ("d1", None)
+    assert (second_dir.parent_directory_id, second_dir.v) == ("d1", 3)
+
+
+def test_model_fields_are_mirrored():
+    assert set(FileInfo.model_fields) == set(structs.FastFileInfo.__struct_fields__)
+    assert set(DirectoryInfo.model_fields) == set(
+        structs.FastDirectoryInfo.__struct_fields__,
+    )
+
+
+def test_lsdir_fast(server, body):
+    server.route("/storage/list/public", (200, body))
+    adapter = IagonAdapter("token")
+    try:
+        listing = adapter.lsdir_fast()
+    finally:
+        adapter.close()
+
+    assert [f.file_id for f in listing.data.files] == ["f1", "f2"]
+    assert [d.dir_id for d in listing.data.directories] == ["d1", "d2"]
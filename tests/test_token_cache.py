@@ -0,0 +1,118 @@
+import pytest
+from iagon import IagonAdapter
+from iagon.base import _IDENTITY_CACHE
+from iagon.base import _TOKEN_CACHE
+from iagon.base import NotAuthenticatedError
+from iagon.base import _derive_session_identity
+from iagon.base import _token_cache_key
+from pycardano import HDWallet
+
+
+@pytest.fixture()
+def seed():
+    return "offline test seed"
+
+
+@pytest.fixture()
+def logins(monkeypatch):
+    calls = []
+
+    def fake_login(cls, seed, timeout):
+        calls.append((seed, timeout))
+        return f"token-{len(calls)}"
+
+    monkeypatch.setattr(IagonAdapter, "_login", classmethod(fake_login))
+    _TOKEN_CACHE.clear()
+    yield calls
+    _TOKEN_CACHE.clear()
+
+
+def test_cache_key_hides_seed(seed):
+    key = _token_cache_key(seed)
+
+    assert seed not in key
+    assert key == _token_cache_key(seed)
+    assert key != _token_cache_key(seed + " ")
+
+
+def test_cached_token_is_reused(seed, logins):
+    with IagonAdapter.session(seed) as adapter:
+        assert adapter.auth_header == {"Authorization": "Bearer token-1"}
+
+    with IagonAdapter.session(seed) as adapter:
+        assert adapter.auth_header == {"Authorization": "Bearer token-1"}
+
+    assert logins == [(seed, (5.0, 30.0))]
+
+
+def test_login_uses_session_timeout(seed, logins):
+    with IagonAdapter.session(seed, timeout=1.0):
+        pass
+
+    assert logins == [(seed, 1.0)]
+
+
+def test_login_forwards_timeout(seed, monkeypatch):
+    timeouts = []
+
+    def nonce(cls, address, timeout):
+        timeouts.append(timeout)
+        return "nonce"
+
+    def verify(cls, address, signature, key, timeout):
+        timeouts.append(timeout)
+        return "token"
+
+    monkeypatch.setattr(IagonAdapter, "nonce", classmethod(nonce))
+    monkeypatch.setattr(IagonAdapter, "verify", classmethod(verify))
+
+    assert IagonAdapter._login(HDWallet.generate_mnemonic(), timeout=2.0) == "token"
+    assert timeouts == [2.0, 2.0]
+
+
+def test_cache_disabled(seed, logins):
+    with IagonAdapter.session(seed, cache_token=False):
+        pass
+
+    with IagonAdapter.session(seed, cache_token=False) as adapter:
+        assert adapter.auth_header == {"Authorization": "Bearer token-2"}
+
+    assert len(logins) == 2
+
+
+def test_expired_token_is_refreshed(seed, logins):
+    with IagonAdapter.session(seed, token_ttl=-1):
+        pass
+
+    with IagonAdapter.session(seed) as adapter:
+        assert adapter.auth_header == {"Authorization": "Bearer token-2"}
+
+    assert len(logins) == 2
+
+
+def test_rejected_token_is_evicted(seed, logins):
+    with pytest.raises(NotAuthenticatedError):
+        with IagonAdapter.session(seed):
+            raise NotAuthenticatedError
+
+    assert _token_cache_key(seed) not in _TOKEN_CACHE
+
+    with IagonAdapter.session(seed) as adapter:
+        assert adapter.auth_header == {"Authorization": "Bearer token-2"}
+
+
+def test_identity_cache_hides_seed(monkeypatch):
+    monkeypatch.setattr("iagon.base._IDENTITY_CACHE_SIZE", 2)
+    _IDENTITY_CACHE.clear()
+    seeds = [HDWallet.generate_mnemonic() for _ in range(3)]
+
+    identity = _derive_session_identity(seeds[0])
+
+    assert _derive_session_identity(seeds[0]) is identity
+    assert list(_IDENTITY_CACHE) == [_token_cache_key(seeds[0])]
+
+    for seed in seeds[1:]:
+        _derive_session_identity(seed)
+
+    assert list(_IDENTITY_CACHE) == [_token_cache_key(seed) for seed in seeds[1:]]
+    _IDENTITY_CACHE.clear()
@@ -0,0 +1,58 @@
+import os
+import threading
+
+import pytest
+import requests
+from iagon import IagonAdapter
+from iagon.base import _TOKEN_CACHE
+
+
+def test_upload_from_pipe(server, transport):
+    server.route("/storage/upload/", (200, {"success": True, "data": {"id": "file"}}))
+    data = os.urandom(100_000)
+
+    read_fd, write_fd = os.pipe()
+
+    def write():
+        with os.fdopen(write_fd, "wb") as fw:
+            fw.write(data)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    adapter = IagonAdapter("token", transport=transport)
+    try:
+        with os.fdopen(read_fd, "rb") as fh:
+            file_id = adapter.upload("pipe.bin", fh)
+    finally:
+        adapter.close()
+        writer.join()
+
+    [(_, _, headers, body)] = server.hits("/storage/upload/")
+    assert file_id.file_id == "file"
+    assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert "Transfer-Encoding" not in headers
+    assert data in body
+
+
+def test_session_forwards_adapter_options(transport, monkeypatch):
+    class Adapter(IagonAdapter):
+        pass
+
+    monkeypatch.setattr(
+        IagonAdapter, "_login", classmethod(lambda cls, seed, timeout: "tok")
+    )
+    _TOKEN_CACHE.clear()
+
+    with Adapter.session(
+        "offline test seed",
+        cache_token=False,
+        timeout=1.0,
+        transfer_timeout=(1.0, 2.0),
+        transport=transport,
+    ) as adapter:
+        assert type(adapter) is Adapter
+        assert adapter.timeout == 1.0
+        assert adapter.transfer_timeout == (1.0, 2.0)
+        assert isinstance(adapter._session, requests.Session) == (
+            transport == "requests"
+        )